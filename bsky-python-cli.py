@@ -1,16 +1,25 @@
 import argparse
+import base64
+import io
 import json
+import orjson
 import os
 import re
 import requests
+import shutil
 import sys
+import tempfile
+import time
 import urllib3
-import uuid
 
 from bs4 import BeautifulSoup
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from PIL import Image
+from requests.adapters import HTTPAdapter
 from typing import List, Dict
+from urllib.parse import urlparse
+from urllib3.util.retry import Retry
 
 
 VERSION = '0.2'
@@ -76,104 +85,192 @@ DEBUG = True
 #################
 
 
+# one keep-alive session shared by every request so we don't pay a fresh TCP+TLS handshake per call
+SESSION = requests.Session()
+SESSION.headers["User-Agent"] = f"bsky-python-cli/{VERSION}"
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    # back off and retry timeouts and 5xx responses. urllib3 only retries idempotent
+    # methods by default, so a createRecord POST is never sent (and posted) twice.
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=(500, 502, 503, 504), raise_on_status=False),
+))
+
+# (connect, read) seconds, so a stalled connection can't hang the CLI forever
+_TIMEOUT = (3.05, 10)
+
+# separate session for third-party hosts (website cards) so the Bluesky token is never sent to them
+WEB_SESSION = requests.Session()
+WEB_SESSION.headers["User-Agent"] = f"bsky-python-cli/{VERSION}"
+
+# website cards fall back to verify=False on certificate errors, don't warn about it on every request
+urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+# state persisted between runs: resolved handle -> DID map, and access/refresh tokens
+CACHE_DIR          = os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'), 'bsky-python-cli')
+DID_CACHE_PATH     = os.path.join(CACHE_DIR, 'dids.json')
+SESSION_CACHE_PATH = os.path.join(CACHE_DIR, 'session.json')
+DID_CACHE_MAX_AGE  = 24 * 60 * 60  # seconds, handles can move to a different DID
+
+_URL_RE     = re.compile(r'https?://\S+')
+_MENTION_RE = re.compile(r'@\w+')
+
+_MIMETYPES = {
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.png': 'image/png',
+    '.webp': 'image/webp',
+    '.gif': 'image/gif',
+}
+
+
+def load_json_cache(path):  # returns {} if the cache is missing or unreadable
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_json_cache(path, data, mode=0o644):
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+        os.chmod(path, mode)  # in case the file already existed with other permissions
+        with os.fdopen(fd, 'w') as f:
+            json.dump(data, f)
+    except OSError as e:
+        print(f"Unable to write cache file '{path}': {e}")
+
+
+_did_cache = load_json_cache(DID_CACHE_PATH)
+
+
+def cached_did(handle):  # DID from the cache, None if missing or older than DID_CACHE_MAX_AGE
+    entry = _did_cache.get(handle)
+    if not isinstance(entry, dict) or time.time() - entry.get('resolved', 0) > DID_CACHE_MAX_AGE:
+        return None
+    return entry.get('did')
+
+
+def utf8_spans(pattern, post_string):  # yield (match, byteStart, byteEnd) for each match
+    """
+        Facet byteStart/byteEnd are UTF-8 byte offsets, not str indexes.
+        Matching runs on the str (so Unicode whitespace still ends a URL)
+        and offsets are converted while walking the matches in order,
+        encoding each piece of text only once.
+    """
+    char_pos = byte_pos = 0
+    for m in pattern.finditer(post_string):
+        byte_pos += len(post_string[char_pos:m.start()].encode('utf-8'))
+        byte_start = byte_pos
+        byte_pos += len(m.group().encode('utf-8'))
+        char_pos = m.end()
+        yield m.group(), byte_start, byte_pos
+
+
 def find_url_data(post_string):  # find URL locations within text
-    pattern = re.compile(r'https?://\S+')
-    matches = re.findall(pattern, post_string)
-    result  = {}
-    for i, url in enumerate(matches, start=1):
-        start          = post_string.index(url)
-        end            = start + len(url)
-        result[str(i)] = {"URL": url, "byteStart": start, "byteEnd": end}
-    return result
+    return [
+        {"URL": url, "byteStart": start, "byteEnd": end}
+        for url, start, end in utf8_spans(_URL_RE, post_string)
+    ]
 
 
 def parse_url_facets(url_data):  # convert URLs in text into 'facets'
-    facet_list = []
-    for key, value in url_data.items():
-        URL       = value['URL']
-        byteStart = value['byteStart']
-        byteEnd   = value['byteEnd']
-        url_facet = {
+    return [
+        {
             "index": {
-                "byteStart": int(byteStart),
-                "byteEnd": int(byteEnd)
+                "byteStart": int(value['byteStart']),
+                "byteEnd": int(value['byteEnd'])
             },
             "features": [
                 {
                     "$type": "app.bsky.richtext.facet#link",
-                    "uri": str(URL)
+                    "uri": str(value['URL'])
                 }
             ]
         }
-        facet_list.append(url_facet)
-    return facet_list
+        for value in url_data
+    ]
 
 
 def find_mentions(post_string):  # find handle mentions in text ('@person')
-    pattern = re.compile(r'@\w+')
-    matches = re.findall(pattern, post_string)
-    result  = {}
-    for i, handle in enumerate(matches, start=1):
-        start = post_string.index(handle)
-        end   = start + len(handle)
-        result[str(i)] = {"handle": handle, "byteStart": start, "byteEnd": end}
-    return result
+    return [
+        {"handle": handle, "byteStart": start, "byteEnd": end}
+        for handle, start, end in utf8_spans(_MENTION_RE, post_string)
+    ]
+
+
+def resolve_handle(handle):  # look up the DID for a single handle
+    return SESSION.get(
+        "https://bsky.social/xrpc/com.atproto.identity.resolveHandle",
+        params={"handle": handle},
+        timeout=_TIMEOUT,
+    )
 
 
 def get_mention_data(mention):  # get the handle's DID to create the mention facet
-    mention_list = []
-    for key, value in mention.items():
-        if 'handle' in value:
-            handle    = value['handle'][1:] + '.bsky.social'
-            byteStart = value['byteStart']
-            byteEnd   = value['byteEnd']
-
-            resp = requests.get(
-                "https://bsky.social/xrpc/com.atproto.identity.resolveHandle",
-                params={"handle": handle},
-            )
+    mention = [value for value in mention if 'handle' in value]
+    handles = [value['handle'][1:] + '.bsky.social' for value in mention]
+
+    # only look up handles we haven't resolved recently
+    misses = list(dict.fromkeys(handle for handle in handles if cached_did(handle) is None))
+    if misses:
+        # resolve every missing handle in parallel rather than paying one round-trip each
+        with ThreadPoolExecutor(max_workers=min(8, len(misses))) as executor:
+            responses = list(executor.map(resolve_handle, misses))
+
+        not_found = False
+        for handle, resp in zip(misses, responses):
             if resp.status_code == 400:
-                return {}  # if handle DID not found, return empty dict
-
-            did = resp.json()["did"]
-
-            mention_facet = {
-                  "index": {
-                    "byteStart": int(byteStart),
-                    "byteEnd": int(byteEnd)
-                  },
-                  "features": [
-                    {
-                      "$type": "app.bsky.richtext.facet#mention",
-                      "did": str(did)
-                    }
-                  ]
-            }
-            mention_list.append(mention_facet)
-    return mention_list
+                not_found = True
+                continue
+            _did_cache[handle] = {"did": orjson.loads(resp.content)["did"], "resolved": time.time()}
+        save_json_cache(DID_CACHE_PATH, _did_cache)
 
+        if not_found:
+            return {}  # if handle DID not found, return empty dict
 
-def get_token():  # API token
-    """
-        Get a session token. The API documentation doesn't mention
-        expiry so we're just going to grab a new one each time
-        until we learn otherwise. ¯\_(ツ)_/¯
-    """
+    return [
+        {
+            "index": {
+                "byteStart": int(value['byteStart']),
+                "byteEnd": int(value['byteEnd'])
+            },
+            "features": [
+                {
+                    "$type": "app.bsky.richtext.facet#mention",
+                    "did": str(_did_cache[handle]['did'])
+                }
+            ]
+        }
+        for value, handle in zip(mention, handles)
+    ]
+
+
+def jwt_expiry(jwt):  # read the 'exp' claim without verifying the signature, 0 if unreadable
+    try:
+        payload = jwt.split('.')[1]
+        payload += '=' * (-len(payload) % 4)
+        return int(json.loads(base64.urlsafe_b64decode(payload))['exp'])
+    except (IndexError, KeyError, TypeError, ValueError):
+        return 0
 
-    global token
 
+def create_session():  # log in with the app password
     try:
-        resp = requests.post(
+        resp = SESSION.post(
             "https://bsky.social/xrpc/com.atproto.server.createSession",
-            json={"identifier": BLUESKY_HANDLE, "password": BLUESKY_APP_PASSWORD},
+            headers={"Content-Type": "application/json"},
+            data=orjson.dumps({"identifier": BLUESKY_HANDLE, "password": BLUESKY_APP_PASSWORD}),
+            timeout=_TIMEOUT,
         )
 
         resp.raise_for_status()
-        token = resp.json()
+        session = orjson.loads(resp.content)
 
-        if 'accessJwt' in token:
-            token = resp.json()
-            return token
+        if 'accessJwt' in session:
+            return session
         else:
             print("Error: 'accessJwt' key not found in token")
             print(f"Error: {resp.content}")
@@ -185,32 +282,70 @@ def get_token():  # API token
         sys.exit(1)
 
 
-def upload_image(image_path):  # upload image, get the blob
+def refresh_session(refresh_jwt):  # trade the refresh token for a new session, {} on failure
     try:
-        with open(image_path, "rb") as f:
-            img_bytes = f.read()
-        if len(img_bytes) > 1000000:
-            raise Exception(
-                f"image file size too large. 1000000 bytes maximum, got: {len(img_bytes)}"
-            )
-    except:
+        resp = SESSION.post(
+            "https://bsky.social/xrpc/com.atproto.server.refreshSession",
+            headers={"Authorization": "Bearer " + refresh_jwt},
+            timeout=_TIMEOUT,
+        )
+    except requests.exceptions.RequestException as e:
+        print(f"Refreshing session failed, logging in again: {e}")
+        return {}
+    if resp.status_code != 200:
         return {}
+    return orjson.loads(resp.content)
+
+
+def get_token():  # API token
+    """
+        Get a session token. The session is cached in SESSION_CACHE_PATH
+        and reused until the access token is about to expire, at which
+        point we refresh it. We only log in with the app password when
+        there is no usable cached session.
+    """
+
+    token  = {}
+    now    = time.time()
+    cached = load_json_cache(SESSION_CACHE_PATH)
+    if cached.get('identifier') == BLUESKY_HANDLE:  # ignore sessions cached for another account
+        if jwt_expiry(cached.get('accessJwt', '')) - now > 60:
+            token = cached
+        elif jwt_expiry(cached.get('refreshJwt', '')) - now > 60:
+            token = refresh_session(cached['refreshJwt'])
+
+    if 'accessJwt' not in token:
+        token = create_session()
+
+    if token is not cached:
+        token = {
+            "identifier": BLUESKY_HANDLE,
+            "accessJwt": token["accessJwt"],
+            "refreshJwt": token["refreshJwt"],
+            "did": token["did"],
+        }
+        save_json_cache(SESSION_CACHE_PATH, token, mode=0o600)  # tokens are credentials, owner-only
+
+    SESSION.headers["Authorization"] = "Bearer " + token["accessJwt"]
+    return token
+
 
-    file_name, file_extension = os.path.splitext(image_path)
-    file_extension = file_extension[1:]
-    image_mimetype = f"image/{file_extension}"
+def upload_image(img_file, image_mimetype):  # upload image from a binary file object, get the blob
+    img_size = img_file.seek(0, os.SEEK_END)  # size without reading the image into memory
+    img_file.seek(0)
+    if img_size > 1000000:
+        print(f"image file size too large. 1000000 bytes maximum, got: {img_size}")
+        return {}
 
-    resp = requests.post(
+    resp = SESSION.post(
         "https://bsky.social/xrpc/com.atproto.repo.uploadBlob",
-        headers={
-            "Content-Type": image_mimetype,
-            "Authorization": "Bearer " + token["accessJwt"],
-        },
-        data=img_bytes,
+        headers={"Content-Type": image_mimetype},
+        data=img_file,  # streamed from the file object rather than copied into a bytes object
+        timeout=(_TIMEOUT[0], max(_TIMEOUT[1], img_size / 50000)),  # allow ~50 KB/s for big uploads
     )
 
     resp.raise_for_status()
-    blob = resp.json()["blob"]
+    blob = orjson.loads(resp.content)["blob"]
     return blob
 
 
@@ -219,12 +354,24 @@ def strip_exif_data(image_path):  # delete photo meta
         Client must strip EXIF manually.
         See: https://atproto.com/specs/xrpc#security-and-privacy-considerations
     """
-    try:
-        output_path = os.path.splitext(image_path)[0] + '.stripped' + os.path.splitext(image_path)[1]
-        image = Image.open(image_path)
-        image.save(output_path, exif=b'')
-        image.close()
-        return output_path
+    try:  # re-encode in memory, returns (image buffer, mimetype)
+        with Image.open(image_path) as image:
+            # phone cameras often write JPEGs with an MPF segment, which Pillow reports as MPO
+            save_format = 'JPEG' if image.format == 'MPO' else image.format
+            buffer = io.BytesIO()
+            if save_format == 'JPEG':
+                # let libjpeg shrink by a power of two in the DCT domain while decoding, then resample
+                # the rest of the way. draft() alone never goes below the requested size, so without
+                # thumbnail() anything under 4096px on its longest side would not shrink at all.
+                scale = 2048 / max(image.size)
+                if scale < 1:
+                    image.draft('RGB', (max(1, int(image.width * scale)), max(1, int(image.height * scale))))
+                    image.thumbnail((2048, 2048))
+                image.save(buffer, format=save_format, exif=b'', optimize=True)
+            else:
+                image.save(buffer, format=save_format, exif=b'')
+        buffer.seek(0)
+        return buffer, Image.MIME[save_format]
     except Exception as e:
         print(f"Failed to strip EXIF data. {e}")
         if EXIT_ON_FAILED_EXIF:  # for security
@@ -234,70 +381,101 @@ def strip_exif_data(image_path):  # delete photo meta
             return {}
 
 
-def get_website_card(URL):  # aka Open Graph / social card / etc.
+def read_page_head(page, max_bytes=65536):  # read a streamed page only as far as </head>
+    """
+        Open Graph meta lives in <head>, so stop downloading once
+        we've seen it close (or hit max_bytes) instead of pulling
+        the entire article body.
+    """
+    head = bytearray()
+    try:
+        for chunk in page.iter_content(chunk_size=8192):
+            head += chunk
+            if b'</head>' in head[-(len(chunk) + 7):].lower() or len(head) > max_bytes:
+                break
+    finally:
+        page.close()
+    return bytes(head)
+
 
-    global embed
-    embed = {}
+def get_website_card(URL):  # aka Open Graph / social card / etc.
 
-    page = requests.get(URL, verify=False)
+    try:
+        try:
+            page = WEB_SESSION.get(URL, stream=True, timeout=_TIMEOUT)
+        except requests.exceptions.SSLError as e:  # plenty of sites have broken certs, only then skip verification
+            print(f"Certificate verification failed for {URL}, retrying without verification: {e}")
+            page = WEB_SESSION.get(URL, verify=False, stream=True, timeout=_TIMEOUT)
+    except requests.exceptions.RequestException as e:
+        print(f"Fetching card from URL failed: {e}")
+        return {}
 
     if page.status_code == 200:
+        try:  # the timeout only covers the headers, so the body read can still stall
+            head = read_page_head(page)
+        except (requests.exceptions.RequestException, urllib3.exceptions.HTTPError) as e:
+            print(f"Reading card from URL failed: {e}")
+            return {}
+
         try:
-            soup = BeautifulSoup(page.content, 'html.parser')
+            soup = BeautifulSoup(head, 'lxml')
 
             print("\nFetching Open Graph data:\n")
 
-            try:  # try to find a title
-                og_title = soup.find('meta', property='og:title')['content']
-            except Exception as e:
-                print(f"Error getting og:title or tag doesn't exist: {e}")
-                print("Trying to get site title instead")
-                for title in soup.find_all('title'):
-                    title_search = title.get_text()
-                    if title_search:
-                        print(f"Found title via <title> tag: {title_search}")
-                        og_title = title_search
-                    else:
-                        print(f"Can't find any title. Setting og:title to the URL {URL}")
-                        og_title = str(URL)
+            # walk the document once and pick up every tag we might need
+            meta = {}
+            page_title = favicon_url = first_image = None
+            for tag in soup.find_all(['meta', 'title', 'link', 'img']):
+                if tag.name == 'meta':
+                    meta_property = tag.get('property')
+                    if meta_property and meta_property not in meta:
+                        meta[meta_property] = tag.get('content')
+                elif tag.name == 'title':
+                    if page_title is None:
+                        page_title = tag.get_text()
+                elif tag.name == 'link':
+                    if favicon_url is None and 'icon' in (tag.get('rel') or []):
+                        favicon_url = tag.get('href')
+                elif tag.name == 'img':
+                    if first_image is None:
+                        first_image = tag.get('src')
+
+            # try to find a title
+            og_title = meta.get('og:title')
+            if og_title:
+                print(f"Found og:title: {og_title}")
+            else:
+                print("Can't find og:title. Trying to get site title instead")
+                if page_title:
+                    print(f"Found title via <title> tag: {page_title}")
+                    og_title = page_title
+                else:
+                    print(f"Can't find any title. Setting og:title to the URL {URL}")
+                    og_title = str(URL)
             print('--------')
 
-            try:  # see if og:description is defined
-                og_description = soup.find('meta', property='og:description')['content']
-                if og_description:
-                    print(f"Found og:description: {og_description}")
-                else:
-                    og_description = soup.find('meta', property='Description')['content']
-                    if not og_description:
-                        print("Setting og:description to empty")
-                        og_description = ''
-            except Exception as e:
-                print(f"Error getting og:description or tag doesn't exist: {e}")
+            # see if og:description is defined
+            og_description = meta.get('og:description') or meta.get('Description')
+            if og_description:
+                print(f"Found og:description: {og_description}")
+            else:
+                print("Setting og:description to empty")
                 og_description = ''
             print('--------')
 
-            try:  # try to get some sort of image at all
-                og_image = soup.find('meta', property='og:image')['content']
-                if og_image:
-                    print(f"Found og:image: {og_image}")
-            except Exception as e:
-                print(f"Error getting og:image or tag doesn't exist. Attempting to use favicon instead: {e}")
-                # attempt to grab the favicon if that fails
-                favicon_tag = soup.find('link', rel='icon')
-                if favicon_tag:
-                    favicon_url = favicon_tag['href']
-                    og_image = favicon_url
-                    print(f"Found image (favicon): {og_image}")
-                else:  # try for the first <img> tag
-                    print("Can't find favicon. Trying to find the first image on the page.")
-                    image = soup.findAll('img', src=True)
-                    image = image[0]
-                    if image:
-                        og_image = image
-                        print(f"Found image (first <img> tag): {og_image}")
-                    else:   # nothing else we can do
-                        print("Finding any images has failed. Nothing else to try. Setting og:image to 'None'")
-                        og_image = None
+            # try to get some sort of image at all
+            og_image = meta.get('og:image')
+            if og_image:
+                print(f"Found og:image: {og_image}")
+            elif favicon_url:  # attempt to grab the favicon if that fails
+                og_image = favicon_url
+                print(f"Found image (favicon): {og_image}")
+            elif first_image:  # try for the first <img> tag
+                og_image = first_image
+                print(f"Found image (first <img> tag): {og_image}")
+            else:  # nothing else we can do
+                print("Finding any images has failed. Nothing else to try. Web card will not be added.")
+                og_image = None
             print('--------')
 
         except Exception as e:
@@ -305,28 +483,58 @@ def get_website_card(URL):  # aka Open Graph / social card / etc.
             sys.exit(1)
     else:
         print(f"Fetching card from URL failed with status code {page.status_code}")
+        page.close()
+        return {}
+
+    if og_image is None:
         return {}
 
     # download the website card image
-    if og_image is not None:
-        r = requests.get(og_image, allow_redirects=True)
-        if r.status_code == 200:
-            file_extension = og_image.split('.')[-1]
-            file_exists = True
-            while file_exists:  # make sure we don't overwrite any local files
-                card_filename = str(uuid.uuid4()) + '.' + file_extension
-                file_exists = os.path.exists(card_filename)
-            open(card_filename, 'wb').write(r.content)
-        else:
+    try:
+        r = WEB_SESSION.get(og_image, allow_redirects=True, stream=True, timeout=_TIMEOUT)
+    except requests.exceptions.RequestException as e:
+        print(f"Fetching image {og_image} failed: {e}. Web card will not contain image.")
+        return {}
+    with r:
+        if r.status_code != 200:
             print(f"Fetching image {og_image} failed with status code {r.status_code}. Web card will not contain image.")
             return {}
+        if int(r.headers.get('Content-Length', 0)) > 1000000:  # upload_image would reject it anyway
+            print(f"Image {og_image} is larger than 1000000 bytes. Web card will not contain image.")
+            return {}
+        # map the extension ('.jpg' must be image/jpeg, not image/jpg), else trust the server
+        file_extension = os.path.splitext(urlparse(og_image).path)[1].lower()
+        image_mimetype = _MIMETYPES.get(file_extension) or r.headers.get('Content-Type', '').split(';')[0]
+        if not image_mimetype.startswith('image/'):
+            print(f"Can't determine image type of {og_image}. Web card will not contain image.")
+            return {}
+        r.raw.decode_content = True  # undo any gzip/deflate Content-Encoding while copying
+        # unique scratch file in the OS temp dir, so we never touch the user's working directory
+        with tempfile.NamedTemporaryFile(delete=False, suffix=file_extension) as fh:
+            card_filename = fh.name
+            try:
+                shutil.copyfileobj(r.raw, fh, 65536)  # straight from the socket to disk
+            except (requests.exceptions.RequestException, urllib3.exceptions.HTTPError) as e:
+                print(f"Downloading image {og_image} failed: {e}. Web card will not contain image.")
+                fh.close()
+                os.remove(card_filename)
+                return {}
 
     # upload the image to get the blob
+    blob = {}
     try:
-        blob = upload_image(card_filename)
+        with open(card_filename, 'rb') as f:
+            blob = upload_image(f, image_mimetype)
     except Exception as e:
         erroneous_image_data = str(og_image)
         print(f"Error uploading image (err_1): {erroneous_image_data}: {e}")
+    finally:  # delete the image whether or not the upload worked
+        try:
+            os.remove(card_filename)
+        except FileNotFoundError:
+            print(f"The file '{card_filename}' does not exist.")
+        except Exception as e:
+            print(f"An error occurred while deleting the file '{card_filename}': {str(e)}")
 
     if blob:
         link     = blob['ref']['$link']
@@ -352,13 +560,6 @@ def get_website_card(URL):  # aka Open Graph / social card / etc.
               }
             }
 
-        try:  # delete the image
-            os.remove(card_filename)
-        except FileNotFoundError:
-            print(f"The file '{card_filename}' does not exist.")
-        except Exception as e:
-            print(f"An error occurred while deleting the file '{card_filename}': {str(e)}")
-
         return embed
     else:
         erroneous_image_data = str(og_image)
@@ -366,11 +567,25 @@ def get_website_card(URL):  # aka Open Graph / social card / etc.
         return {}
 
 
+def prepare_image(img, alt_text):  # strip EXIF and upload a single image
+    stripped_exif = strip_exif_data(img)  # strip exif since Bsky does not
+    if not stripped_exif:
+        return None
+    img_buffer, image_mimetype = stripped_exif
+    image_blob = upload_image(img_buffer, image_mimetype)  # upload pic to API, get blob
+    if not image_blob:
+        return None
+    return {"alt": str(alt_text) if alt_text else '', "image": image_blob}
+
+
 def prepare_post(post_string, image_blob_list = None):
 
-    url_data   = find_url_data(post_string)
-    url_facets = parse_url_facets(url_data)
-    mentions   = find_mentions(post_string)
+    if post_string:
+        url_data   = find_url_data(post_string)
+        url_facets = parse_url_facets(url_data)
+        mentions   = find_mentions(post_string)
+    else:  # image-only post, nothing to scan for links or mentions
+        url_data = url_facets = mentions = []
 
     # determine which facets exist, if any
     facet_list = []
@@ -402,7 +617,7 @@ def prepare_post(post_string, image_blob_list = None):
         The card won't be shown if there are images so it's a waste of resources.
     """
     if USE_WEBSITE_CARDS and url_data and not image_blob_list:
-        get_card = get_website_card(url_data['1']['URL'])
+        get_card = get_website_card(url_data[0]['URL'])
         if get_card:
             post.update(get_card)
 
@@ -427,24 +642,25 @@ def prepare_post(post_string, image_blob_list = None):
     return post
 
 
-def send_post(prepared_post):
+def send_post(token, prepared_post):
 
-    if DEBUG == True:
+    if DEBUG:
         print("+-------------------+")
         print("| DEBUG (post body) |")
         print("+-------------------+\n\n")
         print("```json\n")
-        print(prepared_post)
+        print(json.dumps(prepared_post, separators=(',', ':'), default=str))
         print("\n```\n+--- end of post body ---+")
 
-    resp = requests.post(
+    resp = SESSION.post(
         "https://bsky.social/xrpc/com.atproto.repo.createRecord",
-        headers={"Authorization": f"Bearer {token['accessJwt']}"},
-        json={
+        headers={"Content-Type": "application/json"},
+        data=orjson.dumps({
             "repo": token["did"],
             "collection": "app.bsky.feed.post",
             "record": prepared_post,
-        },
+        }),
+        timeout=_TIMEOUT,
     )
 
     if resp.status_code == 200:
@@ -481,7 +697,7 @@ def main():
         sys.exit(1)
 
     # get API token
-    get_token()
+    token = get_token()
 
     # if image(s) specified, separate them into a list.
     args_images = args.image
@@ -507,29 +723,19 @@ def main():
         else:
             args_alt_text = [''] * len(args_images)  # pad it if nothing is specified
 
-        # iterate through each image and corresponding alt text
-        blob_list = []
-        for img, corresponding_alt_text in zip(args_images, args_alt_text):  # correlation
-            stripped_exif = strip_exif_data(img)  # strip exif since Bsky does not
-            if stripped_exif:
-                image_blob = upload_image(stripped_exif)  # upload pic to API, get blob
-                if image_blob:  # if blob was successful, add it
-                    alt_text = str(corresponding_alt_text) if corresponding_alt_text else ''
-                    temp_array = [{"alt": corresponding_alt_text, "image": image_blob}]
-                    blob_list.append(temp_array)
-                try:  # delete the temporary stripped file
-                    os.remove(stripped_exif)
-                except FileNotFoundError:
-                    print(f"The file '{stripped_exif}' does not exist.")
-                except Exception as e:
-                    print(f"An error occurred while deleting the file '{stripped_exif}': {str(e)}")
+        # strip and upload each image with its corresponding alt text in parallel
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            blob_list = [
+                [image] for image in executor.map(prepare_image, args_images, args_alt_text)
+                if image
+            ]
         if len(args_images) >= 1:
             prepared_post = prepare_post(args.text, blob_list)
     else:  # if post contains no images:
         prepared_post = prepare_post(args.text)
 
     # finally, post it
-    send_post(prepared_post)
+    send_post(token, prepared_post)
 
 
 if __name__ == "__main__":